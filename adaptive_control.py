@@ -0,0 +1,100 @@
+import random
+import numpy as np
+
+
+class AdaptiveControl:
+    """
+    Adapts operator rates and operator choice while the algorithm runs.
+
+    Rates follow population diversity: when the bits of the population
+    converge, p_mutation and p_inversion are raised, and when diversity is
+    high they decay back towards their configured values. Crossover and
+    mutation methods are picked by probability matching on how often each
+    one produced a child better than its parents.
+    """
+
+    def __init__(self, crossover_methods, mutation_methods, diversity_bounds=(0.1, 0.4),
+                 max_rate=0.5, rate_factor=1.5, learning_rate=0.3, min_share=0.1):
+        if not crossover_methods or not mutation_methods:
+            raise ValueError("At least one crossover and one mutation method must be given.")
+
+        self.diversity_bounds = diversity_bounds
+        self.max_rate = max_rate
+        self.rate_factor = rate_factor
+        self.learning_rate = learning_rate
+        self.min_share = min_share
+        self.quality = {
+            'crossover': {method: 1.0 for method in crossover_methods},
+            'mutation': {method: 1.0 for method in mutation_methods},
+        }
+        self.tracking = len(crossover_methods) > 1 or len(mutation_methods) > 1
+        self._lineage = {}
+
+    @staticmethod
+    def diversity(population: list) -> float:
+        """
+        Mean per-bit diversity of the population, between 0 (all identical) and 1.
+
+        For each bit position with allele frequency p the value 4p(1-p) is the
+        normalised probability that two random members differ there, so the
+        mean over all bits is the normalised average pairwise Hamming distance.
+        """
+        bit_string = ''.join(''.join(chrom.genes) for chrom in population)
+        bits = np.frombuffer(bit_string.encode(), dtype=np.uint8).reshape(len(population), -1)
+        p = (bits == ord('1')).mean(axis=0)
+        return float(np.mean(4 * p * (1 - p)))
+
+    def adapt_rates(self, diversity: float, rates: tuple, base_rates: tuple) -> tuple:
+        """Return the operator rates adjusted for the measured diversity, never below their base values."""
+        low, high = self.diversity_bounds
+        if diversity < low:
+            factor = self.rate_factor
+        elif diversity > high:
+            factor = 1 / self.rate_factor
+        else:
+            return rates
+
+        return tuple(
+            min(max(rate * factor, base), max(self.max_rate, base))
+            for rate, base in zip(rates, base_rates)
+        )
+
+    def choose(self, kind: str) -> str:
+        """Pick a 'crossover' or 'mutation' method, favouring recently successful ones."""
+        quality = self.quality[kind]
+        methods = list(quality)
+        if len(methods) == 1:
+            return methods[0]
+
+        total = sum(quality.values())
+        min_share = min(self.min_share, 0.5 / len(methods))
+        share = 1 - len(methods) * min_share
+        if total > 0:
+            weights = [min_share + share * quality[m] / total for m in methods]
+        else:
+            weights = None
+        return random.choices(methods, weights=weights)[0]
+
+    def track(self, child, crossover_method: str, mutation_method: str, parent_fitness: float):
+        """Remember which operators produced a child until its fitness is known."""
+        if not self.tracking:
+            return
+        self._lineage[child] = (crossover_method, mutation_method, parent_fitness)
+
+    def forget(self, child):
+        """Drop a tracked child that will never get a true fitness value."""
+        self._lineage.pop(child, None)
+
+    def credit(self, child, minimize: bool):
+        """Reward the operators of an evaluated child if it beat its better parent."""
+        lineage = self._lineage.pop(child, None)
+        if lineage is None:
+            return
+
+        crossover_method, mutation_method, parent_fitness = lineage
+        improved = child.fitness < parent_fitness if minimize else child.fitness > parent_fitness
+        reward = 1.0 if improved else 0.0
+
+        for kind, method in (('crossover', crossover_method), ('mutation', mutation_method)):
+            quality = self.quality[kind]
+            quality[method] += self.learning_rate * (reward - quality[method])
@@ -29,6 +29,7 @@ class AppController:
                 'elite_p': gui_data['elite_p'],
                 'crossover_method': gui_data['crossover'],
                 'mutation_method': gui_data['mutation'],
+                'encoding': gui_data['encoding'],
                 'optimization': gui_data['optimization']
             }
 
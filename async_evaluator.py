@@ -0,0 +1,109 @@
+import pickle
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+
+EXECUTORS = ('thread', 'process')
+
+# fitness function of a process pool worker, set once by _init_worker
+_worker_function = None
+
+
+def _init_worker(fitness_function):
+    """Store the fitness function in a process pool worker."""
+    global _worker_function
+    _worker_function = fitness_function
+
+
+def _call_worker_function(values):
+    """Evaluate decoded values with the fitness function stored in this worker."""
+    return _worker_function(values)
+
+
+class AsyncEvaluator:
+    """
+    Evaluates chromosomes on a pool of workers while the caller keeps breeding.
+
+    Chromosomes are submitted as soon as they are produced and handed back in
+    the order their evaluations finish, so slow calls do not hold up fast ones.
+    With n_workers=0 every chromosome is evaluated inline in submit().
+    Process workers receive the fitness function once, when they start.
+    """
+
+    def __init__(self, fitness_function, n_workers=0, executor='thread'):
+        if not isinstance(n_workers, int) or n_workers < 0:
+            raise ValueError("Number of workers must be a non-negative integer.")
+        if executor not in EXECUTORS:
+            raise ValueError(f"Executor must be one of {EXECUTORS}.")
+
+        self.fitness_function = fitness_function
+        self.n_workers = n_workers
+        self._pending = {}
+        self._finished = deque()
+        self._pool = None
+        self._call = fitness_function
+        if n_workers > 0 and executor == 'process':
+            try:
+                pickle.dumps(fitness_function)
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                raise ValueError(f"The 'process' executor requires a picklable fitness function: {e}")
+            self._pool = ProcessPoolExecutor(
+                max_workers=n_workers, initializer=_init_worker, initargs=(fitness_function,))
+            self._call = _call_worker_function
+        elif n_workers > 0:
+            self._pool = ThreadPoolExecutor(max_workers=n_workers)
+
+    def submit(self, chromosome):
+        """Queue a chromosome for evaluation."""
+        if self._pool is None:
+            chromosome.evaluate_fitness(self.fitness_function)
+            self._finished.append(chromosome)
+            return
+        future = self._pool.submit(self._call, chromosome.decode())
+        self._pending[future] = chromosome
+
+    def in_flight(self) -> int:
+        """Number of submitted chromosomes that have not been handed back yet."""
+        return len(self._pending) + len(self._finished)
+
+    def next_completed(self):
+        """Block until an evaluation is finished and return its chromosome."""
+        if not self._finished:
+            if not self._pending:
+                raise ValueError("No chromosomes have been submitted for evaluation.")
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chromosome = self._pending.pop(future)
+                chromosome.fitness = future.result()
+                self._finished.append(chromosome)
+        return self._finished.popleft()
+
+    def drain(self) -> list:
+        """Wait for all submitted chromosomes and return them in completion order."""
+        completed = []
+        while self.in_flight():
+            completed.append(self.next_completed())
+        return completed
+
+    def evaluate(self, chromosomes: list):
+        """
+        Evaluate a batch of chromosomes on the workers and wait for all of them.
+
+        Unlike drain(), this leaves chromosomes submitted earlier untouched,
+        so it can be used while the breeding pipeline still has work in flight.
+        """
+        if self._pool is None:
+            for chromosome in chromosomes:
+                chromosome.evaluate_fitness(self.fitness_function)
+            return
+
+        futures = {self._pool.submit(self._call, c.decode()): c for c in chromosomes}
+        for future in as_completed(futures):
+            futures[future].fitness = future.result()
+
+    def shutdown(self):
+        """Drop outstanding evaluations and stop the workers."""
+        self._pending.clear()
+        self._finished.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
@@ -1,36 +1,165 @@
+import numpy as np
 
-class Chromosome:
-    """Binary representation of a chromosome"""
+ENCODINGS = ('binary', 'gray')
 
-    def __init__(self, genes, bounds, precision):
-        if not isinstance(genes, list) or not all(isinstance(g, str) for g in genes):
-            raise ValueError("Genes must be a list of binary strings.")
+
+def gray_to_binary(value):
+    """
+    Convert Gray-coded integers to plain binary integers.
+
+    Works on Python ints as well as NumPy integer arrays, so a whole batch of
+    genes can be converted at once. Uses a prefix XOR with doubling shifts,
+    which needs only log2(bits) steps instead of one step per bit.
+    """
+    if isinstance(value, int):
+        n_bits = value.bit_length()
+    else:
+        n_bits = int(np.max(value)).bit_length()
+    shift = 1
+    while shift < n_bits:
+        value = value ^ (value >> shift)
+        shift <<= 1
+    return value
+
+
+def binary_to_gray(value):
+    """Convert plain binary integers (or NumPy integer arrays) to Gray code."""
+    return value ^ (value >> 1)
+
+
+def scale_to_bounds(int_value, bound, n_bits, precision):
+    """
+    Map the integer value of an n_bits long gene onto the variable bounds.
+
+    Also accepts a NumPy integer array. np.round can differ from round() right
+    at a rounding tie, so values close to a tie are rounded with round() and
+    both paths give identical results.
+    """
+    real_value = bound[0] + int_value * \
+        (bound[1] - bound[0]) / (2**n_bits - 1)
+    if not isinstance(real_value, np.ndarray):
+        return round(real_value, precision)
+
+    rounded = np.round(real_value, precision)
+    scaled = real_value * 10**precision
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    rounded[near_tie] = [round(v, precision) for v in real_value[near_tie].tolist()]
+    return rounded
+
+
+class GeneSpec:
+    """Decoding metadata shared by every chromosome of a run."""
+
+    __slots__ = ('bounds', 'precision', 'encoding', 'lookup_tables')
+
+    def __init__(self, bounds, precision, encoding='binary', lookup_tables=None):
         if not isinstance(bounds, list) or not all(isinstance(b, tuple) and len(b) == 2 for b in bounds):
             raise ValueError(
                 "Bounds must be a list of tuples with two numeric values.")
         if not isinstance(precision, int) or precision < 0:
             raise ValueError("Precision must be a non-negative integer.")
-        if len(genes) != len(bounds):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Encoding must be one of {ENCODINGS}.")
+        if lookup_tables is not None and len(lookup_tables) != len(bounds):
             raise ValueError(
-                "The number of genes must match the number of bounds.")
+                "There must be one lookup table (or None) per gene.")
 
-        self.genes = genes
         self.bounds = bounds
         self.precision = precision
+        self.encoding = encoding
+        self.lookup_tables = lookup_tables
+
+
+class Chromosome:
+    """
+    Binary representation of a chromosome
+
+    Arguments are validated only by the constructor. Operators that derive
+    new chromosomes from already valid ones go through with_genes(), which
+    shares the GeneSpec of the original and skips validation. The decoded
+    values are cached until the genes are reassigned.
+
+    'estimated' is True while the fitness is a surrogate prediction rather
+    than the value of the fitness function.
+    """
+
+    __slots__ = ('_genes', 'spec', 'fitness', 'estimated', '_decoded')
+
+    def __init__(self, genes, bounds, precision, encoding='binary', lookup_tables=None):
+        if not isinstance(genes, list) or not all(isinstance(g, str) for g in genes):
+            raise ValueError("Genes must be a list of binary strings.")
+        spec = GeneSpec(bounds, precision, encoding, lookup_tables)
+        if len(genes) != len(bounds):
+            raise ValueError(
+                "The number of genes must match the number of bounds.")
+
+        self._genes = genes
+        self.spec = spec
         self.fitness = None
+        self.estimated = False
+        self._decoded = None
+
+    @classmethod
+    def from_spec(cls, genes, spec):
+        """Create a chromosome from trusted genes and a shared GeneSpec without validation."""
+        chromosome = cls.__new__(cls)
+        chromosome._genes = genes
+        chromosome.spec = spec
+        chromosome.fitness = None
+        chromosome.estimated = False
+        chromosome._decoded = None
+        return chromosome
+
+    def with_genes(self, genes):
+        """Create an unevaluated chromosome with new genes and the same GeneSpec."""
+        return Chromosome.from_spec(genes, self.spec)
+
+    @property
+    def genes(self):
+        return self._genes
+
+    @genes.setter
+    def genes(self, genes):
+        self._genes = genes
+        self._decoded = None
+
+    @property
+    def bounds(self):
+        return self.spec.bounds
+
+    @property
+    def precision(self):
+        return self.spec.precision
+
+    @property
+    def encoding(self):
+        return self.spec.encoding
+
+    @property
+    def lookup_tables(self):
+        return self.spec.lookup_tables
 
     def decode(self):
         """Decode binary chromosome to real values"""
+        if self._decoded is None:
+            self._decoded = self._decode_genes()
+        return list(self._decoded)
+
+    def _decode_genes(self):
+        spec = self.spec
         decoded_values = []
-        for i, gene in enumerate(self.genes):
-            bound = self.bounds[i]
-            m = len(gene)
+        for i, gene in enumerate(self._genes):
             int_value = int(gene, 2)
-            real_value = bound[0] + int_value * \
-                (bound[1] - bound[0]) / (2**m - 1)
-            real_value = round(real_value, self.precision)
+            table = spec.lookup_tables[i] if spec.lookup_tables else None
+            if table is not None:
+                decoded_values.append(float(table[int_value]))
+                continue
+            if spec.encoding == 'gray':
+                int_value = gray_to_binary(int_value)
+            real_value = scale_to_bounds(
+                int_value, spec.bounds[i], len(gene), spec.precision)
             decoded_values.append(real_value)
-        return decoded_values
+        return tuple(decoded_values)
 
     def evaluate_fitness(self, func=None):
         """Evaluate the fitness of the chromosome using the provided function."""
@@ -1,6 +1,7 @@
 import sqlite3
 import json
 import datetime
+from history import History
 
 class DatabaseManager:
     def __init__(self, db_file_path):
@@ -33,39 +34,75 @@ class DatabaseManager:
             FOREIGN KEY (run_id) REFERENCES runs (run_id)
         )
         """)
+
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS pareto_front (
+            point_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL,
+            values_json TEXT NOT NULL,
+            objectives_json TEXT NOT NULL,
+            FOREIGN KEY (run_id) REFERENCES runs (run_id)
+        )
+        """)
         conn.commit()
         conn.close()
 
-    def save_run_results(self, config, epochs, func_name, history):
-        """Saves a complete run (config + all epoch results) to the database."""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
+    def save_run_results(self, config, epochs, func_name, history, pareto_front=None):
+        """
+        Saves a complete run (config + all epoch results) to the database.
+        Multi-objective runs ('optimization': 'multi') must pass the final
+        Pareto front; its points are stored instead of the per-epoch
+        single-objective results.
+        """
+        if not isinstance(history, History) or not history:
+            raise TypeError("History format is incorrect. Expected a non-empty History.")
+
+        multi_objective = config.get('optimization') == 'multi'
+        if multi_objective and pareto_front is None:
+            raise ValueError("A Pareto front must be given to save a multi-objective run.")
+        if not multi_objective and 'best_fitness' not in history.columns:
+            raise TypeError("History format is incorrect. Expected single-objective statistics.")
+
         run_time = datetime.datetime.now().isoformat()
         config_to_save = config.copy()
         config_to_save['bounds'] = list(config_to_save['bounds'])
         config_str = json.dumps(config_to_save, indent=2)
-        
-        cursor.execute(
-            "INSERT INTO runs (timestamp, benchmark_function, epochs, config_json) VALUES (?, ?, ?, ?)",
-            (run_time, func_name, epochs, config_str)
-        )
-        run_id = cursor.lastrowid
 
-        if not history or not isinstance(history, list) or not isinstance(history[0], dict):
-            raise TypeError("History format is incorrect. Expected a list of dictionaries.")
+        conn = sqlite3.connect(self.db_file)
+        try:
+            cursor = conn.cursor()
 
-        results_data = [
-            (run_id, h['epoch'], h['best_fitness'], h['average_fitness'], h['std_fitness'])
-            for h in history
-        ]
-        
-        cursor.executemany(
-            "INSERT INTO results (run_id, epoch, best_fitness, avg_fitness, std_dev) VALUES (?, ?, ?, ?, ?)",
-            results_data
-        )
+            cursor.execute(
+                "INSERT INTO runs (timestamp, benchmark_function, epochs, config_json) VALUES (?, ?, ?, ?)",
+                (run_time, func_name, epochs, config_str)
+            )
+            run_id = cursor.lastrowid
 
-        conn.commit()
-        conn.close()
+            if multi_objective:
+                front_data = [
+                    (run_id, json.dumps(c.decode()), json.dumps([float(f) for f in c.fitness]))
+                    for c in pareto_front
+                ]
+                cursor.executemany(
+                    "INSERT INTO pareto_front (run_id, values_json, objectives_json) VALUES (?, ?, ?)",
+                    front_data
+                )
+            else:
+                results_data = [
+                    (run_id, epoch, best, avg, std)
+                    for epoch, best, avg, std in zip(
+                        history.epochs.tolist(),
+                        history.column('best_fitness').tolist(),
+                        history.column('average_fitness').tolist(),
+                        history.column('std_fitness').tolist())
+                ]
+
+                cursor.executemany(
+                    "INSERT INTO results (run_id, epoch, best_fitness, avg_fitness, std_dev) VALUES (?, ?, ?, ?, ?)",
+                    results_data
+                )
+
+            conn.commit()
+        finally:
+            conn.close()
         print(f"Results successfully saved to {self.db_file} (Run ID: {run_id})")
-        
\ No newline at end of file
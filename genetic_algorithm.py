@@ -1,96 +1,143 @@
+import heapq
 import random
 import numpy as np
-from chromosome import Chromosome
-from crossover_methods import CrossoverMethods
-from mutation_methods import MutationMethods
-from inversion_methods import InversionMethods
-from selection_methods import SelectionMethods
+from adaptive_control import AdaptiveControl
+from async_evaluator import AsyncEvaluator, EXECUTORS
+from chromosome import Chromosome, GeneSpec, ENCODINGS, gray_to_binary, scale_to_bounds
+from history import History, STAT_COLUMNS
+from local_search import LocalSearch
+from nsga2 import NSGA2
+from operator_registry import default_registry
+from surrogate import SurrogateModel
 
 
 class GeneticAlgorithm:
     """Main Genetic Algorithm implementation"""
 
-    def __init__(self, config: dict, fitness_function):
+    def __init__(self, config: dict, fitness_function, registry=None):
         self._validate_config(config)
         if fitness_function is None:
             raise ValueError("A fitness function must be provided for the Genetic Algorithm.")
         self.config = config
         self.fitness_function = fitness_function
+        self.registry = registry if registry is not None else default_registry
         self.population = None
+        self.evaluator = None
+        self.surrogate = None
+        self.p_mutation = config['p_mutation']
+        self.p_inversion = config['p_inversion']
+        self._resolve_operators()
+        self.adaptive = self._build_adaptive_control()
+        self.decode_tables = self._build_decode_tables() if config.get('decode_lut', False) else None
 
     def initialize_population(self) -> list:
         """Initialize population with random binary chromosomes"""
         population_size = self.config['population_size']
-        n_variables = self.config['n_variables']
-        bounds = self.config['bounds']
-        precision = self.config['precision']
+        spec = GeneSpec(
+            self.config['bounds'],
+            self.config['precision'],
+            self.config.get('encoding', 'binary'),
+            self.decode_tables)
 
         population = []
 
         for _ in range(population_size):
-            chromosome = self._generate_chromosome(
-                n_variables, bounds, precision)
+            chromosome = self._generate_chromosome(spec)
             population.append(chromosome)
 
         self.population = population
         return population
 
     def run(self, epochs: int) -> tuple:
-        """Run the genetic algorithm"""
+        """
+        Run the genetic algorithm
 
+        Returns:
+            tuple: The best solution (the final Pareto front in 'multi' mode) and the History of the run
+        """
+        self.evaluator = AsyncEvaluator(
+            self.fitness_function,
+            self.config.get('evaluation_workers', 0),
+            self.config.get('evaluation_executor', 'thread'))
+        try:
+            return self._evolve(epochs)
+        finally:
+            self.evaluator.shutdown()
+            self.evaluator = None
+
+    def _evolve(self, epochs: int) -> tuple:
+        """Main loop of the algorithm, evaluating through self.evaluator."""
+        self.p_mutation = self.config['p_mutation']
+        self.p_inversion = self.config['p_inversion']
+        self.adaptive = self._build_adaptive_control()
         self.initialize_population()
 
         for chrom in self.population:
-            chrom.evaluate_fitness(self.fitness_function)
-
-        history = []
+            self.evaluator.submit(chrom)
+        self.population = self.evaluator.drain()
+
+        self.surrogate = None
+        if self.config.get('surrogate', False):
+            self.surrogate = SurrogateModel(
+                self.config['bounds'],
+                self.config.get('surrogate_neighbors', 5),
+                self.config.get('surrogate_archive_size', 2000))
+            for chrom in self.population:
+                self.surrogate.add(chrom.decode(), chrom.fitness)
+
+        if self.config['optimization'] == 'multi':
+            return self._evolve_pareto(epochs)
+
+        steady_state = self.config.get('generation_model', 'generational') == 'steady_state'
+        if steady_state:
+            self._reset_running_stats()
+
+        adaptive_rates = self.config.get('adaptive_rates', False)
+        extra_columns = ('diversity', 'p_mutation', 'p_inversion') if adaptive_rates else ()
+        if self.surrogate is not None:
+            extra_columns += ('surrogate_error', 'evaluations_saved')
+        local_search = self.config.get('local_search')
+        if local_search is not None:
+            extra_columns += ('local_search_evaluations',)
+        history = History(epochs, STAT_COLUMNS + extra_columns, limit=self.config.get('history_limit'))
 
         print("=== START GENETIC ALGORITHM ===")
 
         for epoch in range(epochs):
             print(f"\nEpoch {epoch + 1}/{epochs}")
 
-            new_population = []
+            if steady_state:
+                offspring = self._steady_state_step()
+
+                print("Offspring inserted into the population:")
+                for i, c in enumerate(offspring):
+                    print(f"  Chromosome {i + 1}: {c.genes}, Fitness: {c.fitness}")
+                    print(f"Values: {c.decode()}")
+            else:
+                self._generational_step()
 
-            elite = self._get_elite(self.population)
-            new_population.extend(elite)
+                print("Population after mutation, crossover and inversion:")
+                for i, c in enumerate(self.population):
+                    print(f"  Chromosome {i + 1}: {c.genes}, Fitness: {c.fitness}")
+                    print(f"Values: {c.decode()}")
 
-            parents = self._selection()
+            local_search_evaluations = 0
+            if local_search is not None and (epoch + 1) % self.config.get('local_search_interval', 10) == 0:
+                local_search_evaluations = self._refine_elite(steady_state)
+                print(f"Local search ({local_search}) used {local_search_evaluations} evaluations")
 
-            while len(new_population) < len(self.population):
-                parent1, parent2 = random.sample(parents, 2)
+            stats = self._running_stats() if steady_state else self._calculate_stats()
+            best_solution = self._steady_state_best() if steady_state else self._get_best_solution()
+            stats['best_fitness'] = best_solution.fitness
+
+            if adaptive_rates:
+                stats.update(self._adapt_rates())
+            if self.surrogate is not None:
+                stats.update(self._surrogate_stats)
+            if local_search is not None:
+                stats['local_search_evaluations'] = local_search_evaluations
 
-                child1, child2 = self._crossover(parent1, parent2)
-
-                child1 = self._mutation(child1)
-                child1 = self._inversion(child1)
-                child1.evaluate_fitness(self.fitness_function)
-                new_population.append(child1)
-
-                if len(new_population) < len(self.population):
-                    child2 = self._mutation(child2)
-                    child2 = self._inversion(child2)
-                    child2.evaluate_fitness(self.fitness_function)
-                    new_population.append(child2)
-
-            self.population = new_population
-
-            print("Population after mutation, crossover and inversion:")
-            for i, c in enumerate(self.population):
-                print(f"  Chromosome {i + 1}: {c.genes}, Fitness: {c.fitness}")
-                print(f"Values: {c.decode()}")
-            
-            best_solution = self._get_best_solution()
-            stats = self._calculate_stats()
-            history.append({
-                'epoch': epoch + 1,
-                'best_solution': best_solution,
-                'best_fitness': best_solution.fitness,
-                'average_fitness': stats['average_fitness'],
-                'max_fitness': stats['max_fitness'],
-                'min_fitness': stats['min_fitness'],
-                'std_fitness': stats['std_fitness']
-            })
+            history.record(epoch + 1, stats, best_solution.genes)
 
             print(f"\nBest solution in epoch {epoch + 1}:")
             print(f"  Chromosome: {best_solution.genes}, Fitness: {best_solution.fitness}")
@@ -103,22 +150,328 @@ class GeneticAlgorithm:
         print("\n=== END OF ALGORITHM RUN ===")
         return best_solution, history
 
+    def _refine_elite(self, steady_state: bool) -> int:
+        """
+        Memetic stage: improve the best 'local_search_top_k' members with a budgeted local search.
+
+        Improved chromosomes are written back into the population in place.
+        Candidates go through self.evaluator in batches of one per worker.
+
+        Returns:
+            int: Number of fitness evaluations spent by the local search
+        """
+        search = LocalSearch.bit_climbing if self.config['local_search'] == 'bit_climbing' else LocalSearch.pattern_search
+        minimize = self.config.get('optimization', 'max') == 'min'
+        budget = self.config.get('local_search_budget', 20)
+        batch_size = max(1, self.evaluator.n_workers)
+
+        order = sorted(range(len(self.population)), key=lambda i: self.population[i].fitness, reverse=not minimize)
+        targets = [i for i in order if not self.population[i].estimated][:self.config.get('local_search_top_k', 1)]
+
+        evaluations = 0
+        for index in targets:
+            refined, used = search(self.population[index], self._evaluate_candidates, budget, minimize, batch_size)
+            evaluations += used
+            if refined is not self.population[index]:
+                if steady_state:
+                    self._replace_member(index, refined)
+                else:
+                    self.population[index] = refined
+        return evaluations
+
+    def _evaluate_candidates(self, chromosomes: list) -> list:
+        """Evaluate local search candidates, archiving them for the surrogate if there is one."""
+        self.evaluator.evaluate(chromosomes)
+        if self.surrogate is not None:
+            for chromosome in chromosomes:
+                self.surrogate.add(chromosome.decode(), chromosome.fitness)
+        return [chromosome.fitness for chromosome in chromosomes]
+
+    def _evolve_pareto(self, epochs: int) -> tuple:
+        """Multi-objective main loop (NSGA-II) on an already evaluated population."""
+        population_size = self.config['population_size']
+        objectives = self.config['objectives']
+        self._sort_population(self.population)
+
+        adaptive_rates = self.config.get('adaptive_rates', False)
+        columns = (('front_size',)
+                   + tuple(f'best_objective_{i + 1}' for i in range(len(objectives)))
+                   + tuple(f'average_objective_{i + 1}' for i in range(len(objectives))))
+        if adaptive_rates:
+            columns += ('diversity', 'p_mutation', 'p_inversion')
+        history = History(epochs, columns, limit=self.config.get('history_limit'))
+
+        print("=== START GENETIC ALGORITHM (MULTI-OBJECTIVE) ===")
+
+        for epoch in range(epochs):
+            print(f"\nEpoch {epoch + 1}/{epochs}")
+
+            parents = [self.population[i] for i in NSGA2.crowded_tournament_selection(
+                self._ranks, self._crowding, population_size)]
+
+            submitted = 0
+            while submitted < population_size:
+                parent1, parent2 = random.sample(parents, 2)
+                for child in self._breed(parent1, parent2):
+                    self.evaluator.submit(child)
+                    submitted += 1
+                    if submitted == population_size:
+                        break
+
+            self._sort_population(self.population + self.evaluator.drain())
+
+            front = self._pareto_front()
+            print(f"Pareto front size: {len(front)}")
+
+            stats = {'front_size': len(front)}
+            fitness_values = np.array([c.fitness for c in self.population], dtype=float)
+            for i, direction in enumerate(objectives):
+                column = fitness_values[:, i]
+                stats[f'best_objective_{i + 1}'] = column.min() if direction == 'min' else column.max()
+                stats[f'average_objective_{i + 1}'] = column.mean()
+
+            if adaptive_rates:
+                stats.update(self._adapt_rates())
+
+            history.record(epoch + 1, stats)
+
+        front = self._pareto_front()
+        print("\n=== PARETO FRONT AFTER ALL EPOCHS ===")
+        for i, c in enumerate(front):
+            print(f"  Chromosome {i + 1}: {c.genes}, Fitness: {c.fitness}")
+            print(f"  Values: {c.decode()}")
+
+        print("\n=== END OF ALGORITHM RUN ===")
+        return front, history
+
+    def _sort_population(self, candidates: list):
+        """Keep the population_size best candidates by Pareto front and crowding distance."""
+        signs = np.array([1.0 if d == 'min' else -1.0 for d in self.config['objectives']])
+        fitness_values = np.array([c.fitness for c in candidates], dtype=float)
+        if fitness_values.shape != (len(candidates), len(signs)):
+            raise ValueError(
+                "The fitness function must return one value per entry in 'objectives'.")
+
+        objectives = fitness_values * signs
+        ranks = NSGA2.non_dominated_sort(objectives)
+        crowding = NSGA2.crowding_distance(objectives, ranks)
+        survivors = NSGA2.select_survivors(ranks, crowding, self.config['population_size'])
+
+        self.population = [candidates[i] for i in survivors]
+        self._ranks = ranks[survivors]
+        self._crowding = crowding[survivors]
+
+    def _pareto_front(self) -> list:
+        """Return the non-dominated members of the current population."""
+        return [c for c, rank in zip(self.population, self._ranks) if rank == 0]
+
+    def _adapt_rates(self) -> dict:
+        """Update the operator rates from the population diversity and return the values for the history."""
+        diversity = AdaptiveControl.diversity(self.population)
+        self.p_mutation, self.p_inversion = self.adaptive.adapt_rates(
+            diversity,
+            (self.p_mutation, self.p_inversion),
+            (self.config['p_mutation'], self.config['p_inversion']))
+        return {
+            'diversity': diversity,
+            'p_mutation': self.p_mutation,
+            'p_inversion': self.p_inversion
+        }
+
+    def _generational_step(self):
+        """Replace the whole population with the elite and newly bred offspring."""
+        new_population = []
+
+        elite = self._get_elite(self.population)
+        new_population.extend(elite)
+
+        parents = self._selection()
+
+        n_offspring = len(self.population) - len(elite)
+        offspring = []
+        while len(offspring) < n_offspring:
+            parent1, parent2 = random.sample(parents, 2)
+
+            for child in self._breed(parent1, parent2):
+                offspring.append(child)
+                if self.surrogate is None:
+                    self.evaluator.submit(child)
+                if len(offspring) == n_offspring:
+                    break
+
+        if self.surrogate is not None:
+            new_population.extend(self._screen_offspring(offspring))
+
+        for child in self.evaluator.drain():
+            self._credit(child)
+            new_population.append(child)
+        self.population = new_population
+
+        if self.surrogate is not None:
+            self._update_surrogate(offspring)
+
+    def _screen_offspring(self, offspring: list) -> list:
+        """
+        Submit only the 'surrogate_fraction' of offspring the surrogate ranks best for true evaluation.
+
+        Returns:
+            list: The offspring that were not submitted, with predicted fitness and flagged as estimated
+        """
+        min_archive = self.config.get('surrogate_min_archive', 2 * self.config['population_size'])
+        if len(self.surrogate) < min_archive:
+            for child in offspring:
+                self.evaluator.submit(child)
+            self._predictions = {}
+            return []
+
+        predictions = self.surrogate.predict([child.decode() for child in offspring])
+        order = np.argsort(predictions)
+        if self.config.get('optimization', 'max') == 'max':
+            order = order[::-1]
+
+        n_true = max(1, int(np.ceil(len(offspring) * self.config.get('surrogate_fraction', 0.3))))
+        for i in order[:n_true]:
+            self.evaluator.submit(offspring[i])
+        self._predictions = {offspring[i]: predictions[i] for i in order[:n_true]}
+
+        estimated = []
+        for i in order[n_true:]:
+            child = offspring[i]
+            child.fitness = float(predictions[i])
+            child.estimated = True
+            # a prediction is no evidence that the operators improved anything
+            self.adaptive.forget(child)
+            estimated.append(child)
+        return estimated
+
+    def _update_surrogate(self, offspring: list):
+        """Archive the truly evaluated offspring and record how well the surrogate predicted them."""
+        errors = []
+        for child in offspring:
+            if child.estimated:
+                continue
+            if child in self._predictions:
+                errors.append(abs(self._predictions[child] - child.fitness))
+            self.surrogate.add(child.decode(), child.fitness)
+
+        self._surrogate_stats = {
+            'surrogate_error': float(np.mean(errors)) if errors else np.nan,
+            'evaluations_saved': sum(1 for child in offspring if child.estimated)
+        }
+
+    def _steady_state_step(self) -> list:
+        """
+        Insert 'steady_state_k' evaluated offspring into the current population.
+
+        Returns:
+            list: The evaluated offspring that replaced members of the population
+        """
+        k = self.config.get('steady_state_k', 2)
+        queue_size = max(1, self.evaluator.n_workers)
+
+        offspring = []
+        while len(offspring) < k:
+            while self.evaluator.in_flight() < queue_size:
+                parent1, parent2 = self._selection(num_select=2)
+                for child in self._breed(parent1, parent2):
+                    self.evaluator.submit(child)
+
+            child = self.evaluator.next_completed()
+            self._credit(child)
+            self._replace_member(self._replacement_index(), child)
+            offspring.append(child)
+
+        return offspring
+
+    def _breed(self, parent1: Chromosome, parent2: Chromosome):
+        """
+        Yield the two children of a parent pair after crossover, mutation and inversion.
+
+        Children are produced lazily, so a second child that is not needed is never mutated.
+        """
+        crossover_method = self.adaptive.choose('crossover')
+        parent_fitness = None
+        if self.adaptive.tracking:
+            minimize = self.config.get('optimization', 'max') == 'min'
+            parent_fitness = min(parent1.fitness, parent2.fitness) if minimize else max(parent1.fitness, parent2.fitness)
+
+        for child in self._crossover(parent1, parent2, crossover_method):
+            mutation_method = self.adaptive.choose('mutation')
+            child = self._mutation(child, mutation_method)
+            child = self._inversion(child)
+            self.adaptive.track(child, crossover_method, mutation_method, parent_fitness)
+            yield child
+
+    def _credit(self, child: Chromosome):
+        """Pass the fitness of an evaluated child back to the adaptive control."""
+        self.adaptive.credit(child, self.config.get('optimization', 'max') == 'min')
+
+    def _build_adaptive_control(self) -> AdaptiveControl:
+        """
+        Create the adaptive control for this run.
+
+        Without 'adaptive_operators' the only candidates are the configured
+        crossover and mutation methods, so operator choice stays fixed.
+        """
+        return AdaptiveControl(
+            list(self._crossover_ops), list(self._mutation_ops),
+            diversity_bounds=self.config.get('diversity_bounds', (0.1, 0.4)),
+            max_rate=self.config.get('adaptive_max_rate', 0.5))
+
+    def _replacement_index(self) -> int:
+        """Return the population index to be overwritten by the next steady-state child."""
+        maximize = self.config.get('optimization', 'max') == 'max'
+        if self.config.get('replacement', 'worst') == 'worst':
+            return self._extreme_index(largest=not maximize)
+
+        tournament_size = min(self.config.get('tournament_size', 3), len(self.population))
+        candidates = random.sample(range(len(self.population)), tournament_size)
+
+        key = lambda i: self.population[i].fitness
+        if maximize:
+            return min(candidates, key=key)
+        return max(candidates, key=key)
+
     def _calculate_gene_length(self, bound, precision):
         """Calculate the length of the gene for a given variable based on bounds and precision"""
         len_range = bound[1] - bound[0]
         m = np.ceil(np.log2(len_range * (10 ** precision)))
         return int(m)
 
-    def _generate_chromosome(self, n_variables, bounds, precision):
+    def _build_decode_tables(self) -> list:
+        """
+        Precompute the decoded value of every possible gene, within 'decode_lut_max_entries' in total.
+
+        Returns:
+            list: One table (float64 array indexed by the raw gene value) or None per variable
+        """
+        budget = self.config.get('decode_lut_max_entries', 2**20)
+        encoding = self.config.get('encoding', 'binary')
+        precision = self.config['precision']
+
+        keys = [(bound, self._calculate_gene_length(bound, precision)) for bound in self.config['bounds']]
+
+        tables = {}
+        used = 0
+        for bound, m in sorted(dict.fromkeys(keys), key=lambda key: key[1]):
+            if used + 2**m > budget:
+                continue
+            int_values = np.arange(2**m)
+            if encoding == 'gray':
+                int_values = gray_to_binary(int_values)
+            tables[(bound, m)] = scale_to_bounds(int_values, bound, m, precision)
+            used += 2**m
+        return [tables.get(key) for key in keys]
+
+    def _generate_chromosome(self, spec: GeneSpec):
         """Generate a random binary chromosome"""
         genes = []
-        for i in range(n_variables):
-            bound = bounds[i]
-            m = self._calculate_gene_length(bound, precision)
+        for bound in spec.bounds:
+            m = self._calculate_gene_length(bound, spec.precision)
             gene = ''.join(['1' if random.random()
                                    > 0.5 else '0' for _ in range(m)])
             genes.append(gene)
-        return Chromosome(genes, bounds, precision)
+        return Chromosome.from_spec(genes, spec)
 
     def _validate_config(self, config: dict):
         """Validate configuration parameters"""
@@ -161,88 +514,142 @@ class GeneticAlgorithm:
         if 'optimization' not in config:
             raise ValueError("Missing required config parameter: 'optimization'")
 
-        if config['optimization'] not in ('min', 'max'):
-            raise ValueError("'optimization' must be either 'min' or 'max'")
+        if config['optimization'] not in ('min', 'max', 'multi'):
+            raise ValueError("'optimization' must be either 'min', 'max' or 'multi'")
+
+        if config['optimization'] == 'multi':
+            objectives = config.get('objectives')
+            if not isinstance(objectives, list) or not objectives or any(d not in ('min', 'max') for d in objectives):
+                raise ValueError("'objectives' must be a non-empty list of 'min'/'max' in 'multi' optimization")
+            if config.get('generation_model', 'generational') != 'generational':
+                raise ValueError("'multi' optimization requires the generational model")
+            if config.get('adaptive_operators', False):
+                raise ValueError("'adaptive_operators' is not supported with 'multi' optimization")
+
+        if config.get('local_search') is not None:
+            if config.get('local_search') not in ('bit_climbing', 'pattern_search'):
+                raise ValueError("'local_search' must be either 'bit_climbing' or 'pattern_search'")
+            if config['optimization'] == 'multi':
+                raise ValueError("'local_search' is not supported with 'multi' optimization")
+            for key, default in (('local_search_top_k', 1), ('local_search_interval', 10), ('local_search_budget', 20)):
+                value = config.get(key, default)
+                if not isinstance(value, int) or value <= 0:
+                    raise ValueError(f"'{key}' must be a positive integer")
+
+        if config.get('surrogate', False):
+            if config['optimization'] == 'multi' or config.get('generation_model', 'generational') != 'generational':
+                raise ValueError("'surrogate' requires single-objective optimization with the generational model")
+            fraction = config.get('surrogate_fraction', 0.3)
+            if not isinstance(fraction, (int, float)) or not (0 < fraction <= 1):
+                raise ValueError("'surrogate_fraction' must be between 0 and 1")
+            min_archive = config.get('surrogate_min_archive', 2 * config['population_size'])
+            if not isinstance(min_archive, int) or min_archive <= 0:
+                raise ValueError("'surrogate_min_archive' must be a positive integer")
+            neighbors = config.get('surrogate_neighbors', 5)
+            if not isinstance(neighbors, int) or neighbors <= 0:
+                raise ValueError("'surrogate_neighbors' must be a positive integer")
+            archive_size = config.get('surrogate_archive_size', 2000)
+            if not isinstance(archive_size, int) or archive_size < neighbors:
+                raise ValueError("'surrogate_archive_size' must be an integer not smaller than 'surrogate_neighbors'")
+
+        if config.get('encoding', 'binary') not in ENCODINGS:
+            raise ValueError(f"'encoding' must be one of {ENCODINGS}")
+
+        if config.get('generation_model', 'generational') not in ('generational', 'steady_state'):
+            raise ValueError("'generation_model' must be either 'generational' or 'steady_state'")
+
+        if config.get('generation_model', 'generational') == 'steady_state' and config.get('selection_method') == 'best':
+            raise ValueError("'best' selection always mates the same two members; use 'tournament' or 'roulette' with 'steady_state'")
+
+        k = config.get('steady_state_k', 2)
+        if not isinstance(k, int) or not (1 <= k < config['population_size']):
+            raise ValueError("'steady_state_k' must be a positive integer smaller than population_size")
+
+        if config.get('replacement', 'worst') not in ('worst', 'tournament'):
+            raise ValueError("'replacement' must be either 'worst' or 'tournament'")
+
+        for key in ('adaptive_crossover_methods', 'adaptive_mutation_methods'):
+            if key in config and not config[key]:
+                raise ValueError(f"'{key}' must be a non-empty list of method names")
+
+        if 'diversity_bounds' in config:
+            low, high = config['diversity_bounds']
+            if not (0 <= low < high <= 1):
+                raise ValueError("'diversity_bounds' must be a pair (low, high) with 0 <= low < high <= 1")
+
+        max_rate = config.get('adaptive_max_rate', 0.5)
+        if not isinstance(max_rate, (int, float)) or not (0 < max_rate <= 1):
+            raise ValueError("'adaptive_max_rate' must be between 0 and 1")
+
+        history_limit = config.get('history_limit')
+        if history_limit is not None and (not isinstance(history_limit, int) or history_limit <= 0):
+            raise ValueError("'history_limit' must be a positive integer")
+
+        workers = config.get('evaluation_workers', 0)
+        if not isinstance(workers, int) or workers < 0:
+            raise ValueError("'evaluation_workers' must be a non-negative integer")
+
+        if config.get('evaluation_executor', 'thread') not in EXECUTORS:
+            raise ValueError(f"'evaluation_executor' must be one of {EXECUTORS}")
+
+        max_entries = config.get('decode_lut_max_entries', 2**20)
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError("'decode_lut_max_entries' must be a positive integer")
+
+    def _resolve_operators(self):
+        """
+        Look up the configured operators in the registry once, before the run.
+
+        With 'adaptive_operators' every candidate crossover and mutation method
+        is resolved; 'crossover_method' and 'mutation_method' remain the
+        defaults used when no method is chosen explicitly.
+        """
+        self._crossover_method = self.config.get('crossover_method', 'one_point')
+        self._mutation_method = self.config.get('mutation_method', 'one_point')
+
+        if self.config.get('adaptive_operators', False):
+            crossover_methods = self.config.get('adaptive_crossover_methods', self.registry.names('crossover'))
+            mutation_methods = self.config.get('adaptive_mutation_methods', self.registry.names('mutation'))
+        else:
+            crossover_methods = [self._crossover_method]
+            mutation_methods = [self._mutation_method]
+
+        self._selection_op = self.registry.resolve(
+            'selection', self.config.get('selection_method', 'tournament'))
+        self._crossover_ops = {m: self.registry.resolve('crossover', m) for m in crossover_methods}
+        self._mutation_ops = {m: self.registry.resolve('mutation', m) for m in mutation_methods}
+        self._inversion_op = self.registry.resolve(
+            'inversion', self.config.get('inversion_method', 'two_point'))
 
-    def _selection(self) -> list:
+    def _selection(self, num_select=None) -> list:
         """Select parents from the current population using the configured selection method."""
-        selection_method = self.config.get('selection_method', 'tournament')
         minimize = self.config.get('optimization', 'min') == 'min'
-        num_select = self.config['population_size']
-
-        if selection_method == 'tournament':
-            tournament_size = self.config.get('tournament_size', 3)
-            parents = SelectionMethods.tournament_selection(
-                self.population, tournament_size, num_select, minimize)
-        elif selection_method == 'roulette':
-            parents = SelectionMethods.roulette_wheel_selection(
-                self.population, num_select, minimize)
-        elif selection_method == 'best':
-            parents = SelectionMethods.best_selection(
-                self.population, num_select, minimize)
-        else:
-            raise ValueError(f"Unknown selection method: {selection_method}")
+        if num_select is None:
+            num_select = self.config['population_size']
 
-        return parents
+        return self._selection_op(self.population, num_select, minimize, self.config)
 
-    def _crossover(self, parent1: Chromosome, parent2: Chromosome):
+    def _crossover(self, parent1: Chromosome, parent2: Chromosome, method=None):
         """Perform crossover between two parent chromosomes."""
-        method = self.config.get('crossover_method', 'one_point')
-
-        offspring1_genes = []
-        offspring2_genes = []
-
-        for g1, g2 in zip(parent1.genes, parent2.genes):
-            if method == 'one_point':
-                o1, o2 = CrossoverMethods.one_point_crossover(g1, g2)
-            elif method == 'two_point':
-                o1, o2 = CrossoverMethods.two_point_crossover(g1, g2)
-            elif method == 'uniform':
-                o1, o2 = CrossoverMethods.uniform_crossover(g1, g2)
-            elif method == 'discrete':
-                o1 = CrossoverMethods.discrete_crossover(g1, g2)
-                o2 = CrossoverMethods.discrete_crossover(g2, g1)
-            else:
-                raise ValueError(f"Unknown crossover method: {method}")
-
-            offspring1_genes.append(o1)
-            offspring2_genes.append(o2)
+        crossover_op = self._crossover_ops[method or self._crossover_method]
+        offspring1_genes, offspring2_genes = crossover_op(parent1.genes, parent2.genes)
 
         return (
-            Chromosome(offspring1_genes, parent1.bounds, parent1.precision),
-            Chromosome(offspring2_genes, parent1.bounds, parent1.precision)
+            parent1.with_genes(offspring1_genes),
+            parent1.with_genes(offspring2_genes)
         )
 
-    def _mutation(self, chromosome: Chromosome) -> Chromosome:
+    def _mutation(self, chromosome: Chromosome, method=None) -> Chromosome:
         """Use selected mutation method to on chromosome."""
-        method = self.config.get('mutation_method', 'one_point')
-        p_mutation = self.config.get('p_mutation', 0.05)
-
-        if method == 'one_point':
-            new_genes = MutationMethods.one_point_mutation(chromosome.genes, p_mutation)
-        elif method == 'two_point':
-            new_genes = MutationMethods.two_point_mutation(chromosome.genes)
-        elif method == 'boundary':
-            new_genes = MutationMethods.boundary_mutation(chromosome.genes)
-        else:
-            raise ValueError(f"Unknown mutation method: {method}")
-
-        return Chromosome(new_genes, chromosome.bounds, chromosome.precision)
+        mutation_op = self._mutation_ops[method or self._mutation_method]
+        return chromosome.with_genes(mutation_op(chromosome.genes, self.p_mutation))
 
     def _inversion(self, chromosome: Chromosome) -> Chromosome:
         """Apply selected inversion method to a chromosome."""
-        method = self.config.get('inversion_method', 'two_point')
-        p_inversion = self.config.get('p_inversion', 0.05)
-
-        if random.random() >= p_inversion:
+        if random.random() >= self.p_inversion:
             return chromosome
 
-        if method == 'two_point':
-            new_genes = InversionMethods.two_point_inversion(chromosome.genes)
-        else:
-            raise ValueError(f"Unknown inversion method: {method}")
-
-        return Chromosome(new_genes, chromosome.bounds, chromosome.precision)
+        return chromosome.with_genes(self._inversion_op(chromosome.genes))
 
     def _get_elite(self, population: list) -> list:
         """
@@ -252,8 +659,11 @@ class GeneticAlgorithm:
         elite_p = self.config['elite_p']
         n_elite = max(1, int(len(population) * elite_p))
 
+        # surrogate estimates are never carried over as elite
+        candidates = [c for c in population if not c.estimated] or population
+
         reverse = True if self.config.get('optimization', 'max') == 'max' else False
-        sorted_population = sorted(population, key=lambda c: c.fitness, reverse=reverse)
+        sorted_population = sorted(candidates, key=lambda c: c.fitness, reverse=reverse)
 
         return sorted_population[:n_elite]
     
@@ -262,14 +672,16 @@ class GeneticAlgorithm:
         if not self.population:
             raise ValueError("Population is not initialized.")
 
+        candidates = [c for c in self.population if not c.estimated] or self.population
+
         reverse = True if self.config.get('optimization', 'max') == 'max' else False
-        best_chromosome = max(self.population, key=lambda c: c.fitness) if reverse else min(self.population, key=lambda c: c.fitness)
+        best_chromosome = max(candidates, key=lambda c: c.fitness) if reverse else min(candidates, key=lambda c: c.fitness)
 
         return best_chromosome
     
     def _calculate_stats(self) -> dict:
-        """Calculate statistics of the current population."""
-        fitness_values = [chrom.fitness for chrom in self.population]
+        """Calculate statistics of the current population, ignoring surrogate estimates."""
+        fitness_values = [chrom.fitness for chrom in self.population if not chrom.estimated]
         avg_fitness = sum(fitness_values) / len(fitness_values)
         max_fitness = max(fitness_values)
         min_fitness = min(fitness_values)
@@ -281,3 +693,62 @@ class GeneticAlgorithm:
             'min_fitness': min_fitness,
             'std_fitness': std_fitness
         }
+
+    def _reset_running_stats(self):
+        """Recompute the running fitness sums and the versioned min/max heaps from scratch."""
+        fitness_values = [chrom.fitness for chrom in self.population]
+        # sums are kept relative to the mean at reset to avoid cancellation in the variance
+        self._fitness_shift = sum(fitness_values) / len(fitness_values)
+        self._fitness_sum = sum(f - self._fitness_shift for f in fitness_values)
+        self._fitness_sq_sum = sum((f - self._fitness_shift) ** 2 for f in fitness_values)
+        self._replacements_since_reset = 0
+
+        self._versions = [0] * len(fitness_values)
+        self._min_heap = [(f, i, 0) for i, f in enumerate(fitness_values)]
+        self._max_heap = [(-f, i, 0) for i, f in enumerate(fitness_values)]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
+
+    def _replace_member(self, index: int, chromosome: Chromosome):
+        """Put an evaluated chromosome at the given population index, keeping the running sums in sync."""
+        old_fitness = self.population[index].fitness
+        self.population[index] = chromosome
+        new_delta = chromosome.fitness - self._fitness_shift
+        old_delta = old_fitness - self._fitness_shift
+        self._fitness_sum += new_delta - old_delta
+        self._fitness_sq_sum += new_delta ** 2 - old_delta ** 2
+
+        self._versions[index] += 1
+        version = self._versions[index]
+        heapq.heappush(self._min_heap, (chromosome.fitness, index, version))
+        heapq.heappush(self._max_heap, (-chromosome.fitness, index, version))
+
+        # resync once per population turnover so floating point drift and
+        # outdated heap entries cannot build up
+        self._replacements_since_reset += 1
+        if self._replacements_since_reset >= len(self.population):
+            self._reset_running_stats()
+
+    def _extreme_index(self, largest: bool) -> int:
+        """Return the population index with the largest (or smallest) fitness."""
+        heap = self._max_heap if largest else self._min_heap
+        while heap[0][2] != self._versions[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def _steady_state_best(self) -> Chromosome:
+        """Return the best solution in the current population from the running heaps."""
+        return self.population[self._extreme_index(largest=self.config.get('optimization', 'max') == 'max')]
+
+    def _running_stats(self) -> dict:
+        """Calculate statistics of the current population from the running sums and heaps."""
+        n = len(self.population)
+        mean_delta = self._fitness_sum / n
+        variance = max(self._fitness_sq_sum / n - mean_delta ** 2, 0.0)
+
+        return {
+            'average_fitness': self._fitness_shift + mean_delta,
+            'max_fitness': self.population[self._extreme_index(largest=True)].fitness,
+            'min_fitness': self.population[self._extreme_index(largest=False)].fitness,
+            'std_fitness': np.sqrt(variance)
+        }
@@ -0,0 +1,117 @@
+from bisect import bisect_right
+import numpy as np
+
+STAT_COLUMNS = ('best_fitness', 'average_fitness', 'max_fitness', 'min_fitness', 'std_fitness')
+
+
+class History:
+    """
+    Per-epoch statistics of a run kept in preallocated NumPy arrays.
+
+    The best genotype, when one is given, is stored as packed bits and only in
+    the epochs where it changes, instead of keeping a live Chromosome per
+    epoch. With a limit the arrays act as a ring buffer holding only the most
+    recent epochs.
+
+    Indexing and iteration give one dict per epoch, so code written for a list
+    of dicts keeps working; column() gives a whole statistic as an array.
+    """
+
+    def __init__(self, epochs: int, columns=STAT_COLUMNS, limit=None):
+        if limit is not None and (not isinstance(limit, int) or limit <= 0):
+            raise ValueError("History limit must be a positive integer.")
+
+        self.capacity = max(1, epochs if limit is None else min(epochs, limit))
+        self.columns = tuple(columns)
+        self._epochs = np.zeros(self.capacity, dtype=np.int64)
+        self._data = {name: np.full(self.capacity, np.nan) for name in self.columns}
+        self._count = 0
+
+        self._gene_lengths = None
+        self._last_best_genes = None
+        self._snapshot_epochs = []
+        self._snapshots = []
+
+    def record(self, epoch: int, stats: dict, best_genes=None):
+        """Store the statistics of one epoch and a snapshot of the best genotype if it changed."""
+        index = self._count % self.capacity
+        self._epochs[index] = epoch
+        for name in self.columns:
+            self._data[name][index] = stats[name]
+        self._count += 1
+
+        if best_genes is not None and best_genes != self._last_best_genes:
+            self._add_snapshot(epoch, best_genes)
+        self._drop_old_snapshots()
+
+    def column(self, name: str) -> np.ndarray:
+        """Return one statistic for all retained epochs, oldest first."""
+        if name == 'epoch':
+            return self._ordered(self._epochs)
+        return self._ordered(self._data[name])
+
+    @property
+    def epochs(self) -> np.ndarray:
+        """Epoch numbers of the retained entries, oldest first."""
+        return self.column('epoch')
+
+    def best_genes(self, epoch: int) -> list:
+        """Return the genes of the best solution recorded for the given epoch."""
+        position = bisect_right(self._snapshot_epochs, epoch) - 1
+        if position < 0:
+            raise ValueError(f"No best solution recorded for epoch {epoch}.")
+
+        bits = np.unpackbits(self._snapshots[position], count=sum(self._gene_lengths))
+        bit_string = (bits + ord('0')).tobytes().decode()
+        genes = []
+        start = 0
+        for length in self._gene_lengths:
+            genes.append(bit_string[start:start + length])
+            start += length
+        return genes
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def __getitem__(self, i: int) -> dict:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("History index out of range.")
+
+        index = i if self._count <= self.capacity else (self._count + i) % self.capacity
+        epoch = int(self._epochs[index])
+        entry = {'epoch': epoch}
+        for name in self.columns:
+            entry[name] = float(self._data[name][index])
+        if self._snapshots:
+            entry['best_genes'] = self.best_genes(epoch)
+        return entry
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _ordered(self, array: np.ndarray) -> np.ndarray:
+        if self._count <= self.capacity:
+            return array[:self._count].copy()
+        return np.roll(array, -(self._count % self.capacity))
+
+    def _add_snapshot(self, epoch: int, genes: list):
+        if self._gene_lengths is None:
+            self._gene_lengths = [len(gene) for gene in genes]
+        bits = np.frombuffer(''.join(genes).encode(), dtype=np.uint8) - ord('0')
+        self._snapshot_epochs.append(epoch)
+        self._snapshots.append(np.packbits(bits))
+        self._last_best_genes = list(genes)
+
+    def _drop_old_snapshots(self):
+        """Forget snapshots that no retained epoch refers to any more."""
+        if self._count <= self.capacity:
+            return
+        oldest_epoch = self._epochs[self._count % self.capacity]
+        keep_from = bisect_right(self._snapshot_epochs, oldest_epoch) - 1
+        if keep_from > 0:
+            del self._snapshot_epochs[:keep_from]
+            del self._snapshots[:keep_from]
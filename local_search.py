@@ -0,0 +1,129 @@
+import random
+from chromosome import gray_to_binary, binary_to_gray
+
+
+class LocalSearch:
+    """
+    Budgeted local search used to refine elite chromosomes (memetic stage).
+
+    Both methods take a function that evaluates a list of chromosomes and
+    returns their fitness values, spend at most 'budget' evaluations, and
+    return the best chromosome found together with the number of
+    evaluations used. Candidates are evaluated in batches of 'batch_size',
+    so a parallel evaluator can work on several of them at once; the best
+    improving candidate of a batch is accepted.
+    """
+
+    @staticmethod
+    def bit_climbing(chromosome, evaluate, budget: int, minimize: bool, batch_size: int = 1) -> tuple:
+        """
+        Bit climbing on the binary genotype.
+
+        Single bit flips are tried in random order; an improving flip is kept
+        and the scan starts over, until a full pass finds no improvement or
+        the budget is spent.
+        """
+        best = chromosome
+        used = 0
+        positions = [(i, j) for i, gene in enumerate(best.genes) for j in range(len(gene))]
+
+        improved = True
+        while improved and used < budget:
+            improved = False
+            random.shuffle(positions)
+            for start in range(0, len(positions), batch_size):
+                if used >= budget:
+                    break
+                batch = positions[start:start + min(batch_size, budget - used)]
+
+                candidates = []
+                for i, j in batch:
+                    genes = list(best.genes)
+                    gene = genes[i]
+                    genes[i] = gene[:j] + ('1' if gene[j] == '0' else '0') + gene[j + 1:]
+                    candidates.append(best.with_genes(genes))
+
+                fitness_values = evaluate(candidates)
+                used += len(candidates)
+                winner = LocalSearch._best_improvement(candidates, fitness_values, best.fitness, minimize)
+                if winner is not None:
+                    best = candidates[winner]
+                    improved = True
+                    break
+
+        return best, used
+
+    @staticmethod
+    def pattern_search(chromosome, evaluate, budget: int, minimize: bool, batch_size: int = 1) -> tuple:
+        """
+        Coordinate (Hooke-Jeeves style) pattern search on the decoded values.
+
+        Works on the integer value of each gene, i.e. on the grid of values
+        the precision allows. Every variable is moved by +/- step; after a
+        successful sweep the same move is tried once more as a pattern move,
+        and when a sweep fails the step is halved until it drops below one.
+        """
+        gray = chromosome.encoding == 'gray'
+        lengths = [len(gene) for gene in chromosome.genes]
+        values = [int(gene, 2) for gene in chromosome.genes]
+        if gray:
+            values = [gray_to_binary(v) for v in values]
+
+        def build(int_values):
+            if gray:
+                int_values = [binary_to_gray(v) for v in int_values]
+            return chromosome.with_genes([format(v, f'0{m}b') for v, m in zip(int_values, lengths)])
+
+        def in_range(int_values):
+            return all(0 <= v <= 2**m - 1 for v, m in zip(int_values, lengths))
+
+        best = chromosome
+        used = 0
+        step = max(1, 2 ** max(lengths) // 16)
+        moves = [(i, direction) for i in range(len(lengths)) for direction in (1, -1)]
+
+        while step >= 1 and used < budget:
+            start_values = list(values)
+            position = 0
+            while position < len(moves) and used < budget:
+                trials = []
+                while position < len(moves) and len(trials) < min(batch_size, budget - used):
+                    i, direction = moves[position]
+                    position += 1
+                    trial_values = list(values)
+                    trial_values[i] += direction * step
+                    if in_range(trial_values):
+                        trials.append(trial_values)
+                if not trials:
+                    continue
+
+                candidates = [build(t) for t in trials]
+                fitness_values = evaluate(candidates)
+                used += len(candidates)
+                winner = LocalSearch._best_improvement(candidates, fitness_values, best.fitness, minimize)
+                if winner is not None:
+                    best, values = candidates[winner], trials[winner]
+
+            if values == start_values:
+                step //= 2
+                continue
+
+            pattern_values = [2 * v - s for v, s in zip(values, start_values)]
+            if used < budget and in_range(pattern_values):
+                candidate = build(pattern_values)
+                fitness = evaluate([candidate])[0]
+                used += 1
+                if LocalSearch._best_improvement([candidate], [fitness], best.fitness, minimize) is not None:
+                    best, values = candidate, pattern_values
+
+        return best, used
+
+    @staticmethod
+    def _best_improvement(candidates, fitness_values, reference, minimize):
+        """Return the index of the best candidate that beats the reference fitness, or None."""
+        winner = None
+        for i, fitness in enumerate(fitness_values):
+            target = reference if winner is None else fitness_values[winner]
+            if fitness < target if minimize else fitness > target:
+                winner = i
+        return winner
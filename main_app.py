@@ -54,6 +54,7 @@ class GeneticAlgorithmGUI(tk.Tk):
         self.widgets['selection_method'] = self._create_combo(param_frame, "Selection Method:", ['best', 'tournament', 'roulette_wheel'], 'best', param_row); param_row += 1
         self.widgets['crossover_method'] = self._create_combo(param_frame, "Crossover Method:", ['one_point', 'two_point', 'uniform', 'discrete'], 'two_point', param_row); param_row += 1
         self.widgets['mutation_method'] = self._create_combo(param_frame, "Mutation Method:", ['one_point', 'two_point', 'boundary'], 'one_point', param_row); param_row += 1
+        self.widgets['encoding'] = self._create_combo(param_frame, "Encoding:", ['binary', 'gray'], 'binary', param_row); param_row += 1
         self.widgets['optimization'] = self._create_combo(param_frame, "Optimization:", ['min', 'max'], 'min', param_row); param_row += 1
         self.widgets['db_file'] = self._create_entry(param_frame, "Database File:", "ga_results.db", param_row); param_row += 1
         
@@ -114,6 +115,7 @@ class GeneticAlgorithmGUI(tk.Tk):
                 'selection': self.widgets['selection_method'].get(),
                 'crossover': self.widgets['crossover_method'].get(),
                 'mutation': self.widgets['mutation_method'].get(),
+                'encoding': self.widgets['encoding'].get(),
                 'optimization': self.widgets['optimization'].get(),
                 'db_file': self.widgets['db_file'].get() or "ga_results.db"
             }
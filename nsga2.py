@@ -0,0 +1,74 @@
+import random
+import numpy as np
+
+
+class NSGA2:
+    """Non-dominated sorting and crowding distance used by the multi-objective mode (NSGA-II)."""
+
+    @staticmethod
+    def non_dominated_sort(objectives: np.ndarray) -> np.ndarray:
+        """
+        Assign every point the index of its Pareto front (0 = non-dominated).
+
+        Objectives are an (N, M) array where every column is minimised. The
+        dominance relation for all pairs is computed at once with broadcasting,
+        which is O(M * N^2); fronts are then peeled off by decrementing the
+        domination counts of the points dominated by the current front.
+        """
+        not_worse = (objectives[:, None, :] <= objectives[None, :, :]).all(axis=2)
+        better = (objectives[:, None, :] < objectives[None, :, :]).any(axis=2)
+        dominates = not_worse & better
+
+        domination_count = dominates.sum(axis=0)
+        ranks = np.full(len(objectives), -1)
+        front = np.flatnonzero(domination_count == 0)
+        rank = 0
+        while front.size:
+            ranks[front] = rank
+            domination_count = domination_count - dominates[front].sum(axis=0)
+            domination_count[ranks >= 0] = -1
+            front = np.flatnonzero(domination_count == 0)
+            rank += 1
+        return ranks
+
+    @staticmethod
+    def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+        """Return the crowding distance of every point within its own front."""
+        distance = np.zeros(len(objectives))
+        for rank in np.unique(ranks):
+            members = np.flatnonzero(ranks == rank)
+            if members.size <= 2:
+                distance[members] = np.inf
+                continue
+
+            front = objectives[members]
+            order = np.argsort(front, axis=0)
+            sorted_front = np.take_along_axis(front, order, axis=0)
+            span = sorted_front[-1] - sorted_front[0]
+            span[span == 0] = 1.0
+
+            gaps = np.zeros_like(front)
+            gaps[1:-1] = (sorted_front[2:] - sorted_front[:-2]) / span
+            gaps[0] = gaps[-1] = np.inf
+
+            front_distance = np.zeros_like(front)
+            np.put_along_axis(front_distance, order, gaps, axis=0)
+            distance[members] = front_distance.sum(axis=1)
+        return distance
+
+    @staticmethod
+    def select_survivors(ranks: np.ndarray, crowding: np.ndarray, num_select: int) -> np.ndarray:
+        """Return indices of the best points by front, breaking ties by larger crowding distance."""
+        return np.lexsort((-crowding, ranks))[:num_select]
+
+    @staticmethod
+    def crowded_tournament_selection(ranks: np.ndarray, crowding: np.ndarray, num_select: int) -> list:
+        """Select indices with binary tournaments won by the lower front, then the larger crowding distance."""
+        selected = []
+        for _ in range(num_select):
+            a, b = random.sample(range(len(ranks)), 2)
+            if ranks[a] != ranks[b]:
+                selected.append(a if ranks[a] < ranks[b] else b)
+            else:
+                selected.append(a if crowding[a] >= crowding[b] else b)
+        return selected
@@ -0,0 +1,114 @@
+from crossover_methods import CrossoverMethods
+from mutation_methods import MutationMethods
+from inversion_methods import InversionMethods
+from selection_methods import SelectionMethods
+
+OPERATOR_KINDS = ('selection', 'crossover', 'mutation', 'inversion')
+
+
+class OperatorRegistry:
+    """
+    Genetic operators registered by name and resolved once per run.
+
+    Batch operators work on the whole gene list of a chromosome, scalar ones on
+    a single gene; resolve() lifts scalar operators to the batch form, so the
+    algorithm only ever calls:
+
+        selection: op(population, num_select, minimize, config) -> list
+        crossover: op(genes1, genes2) -> (genes1, genes2)
+        mutation:  op(genes, p_mutation) -> genes
+        inversion: op(genes) -> genes
+
+    Scalar variants take a single gene in place of each gene list. Selection
+    operators always work on the whole population.
+    """
+
+    def __init__(self):
+        self._operators = {kind: {} for kind in OPERATOR_KINDS}
+
+    def register(self, kind: str, name: str, func=None, batch: bool = False):
+        """
+        Register an operator under the given kind and name.
+
+        Can also be used as a decorator: @registry.register('mutation', 'mine')
+        """
+        if kind not in OPERATOR_KINDS:
+            raise ValueError(f"Operator kind must be one of {OPERATOR_KINDS}.")
+
+        def decorator(f):
+            if not callable(f):
+                raise ValueError("An operator must be callable.")
+            self._operators[kind][name] = (f, batch or kind == 'selection')
+            return f
+
+        if func is None:
+            return decorator
+        return decorator(func)
+
+    def names(self, kind: str) -> tuple:
+        """Return the names of all operators of the given kind."""
+        return tuple(self._operators[kind])
+
+    def resolve(self, kind: str, name: str):
+        """Return the batch form of a registered operator."""
+        if name not in self._operators[kind]:
+            raise ValueError(f"Unknown {kind} method: {name}")
+
+        func, batch = self._operators[kind][name]
+        if batch:
+            return func
+        if kind == 'crossover':
+            def lifted(genes1, genes2):
+                pairs = [func(g1, g2) for g1, g2 in zip(genes1, genes2)]
+                return [p[0] for p in pairs], [p[1] for p in pairs]
+        elif kind == 'mutation':
+            def lifted(genes, p_mutation):
+                return [func(gene, p_mutation) for gene in genes]
+        else:
+            def lifted(genes):
+                return [func(gene) for gene in genes]
+        return lifted
+
+    def copy(self):
+        """Return an independent registry with the same operators."""
+        registry = OperatorRegistry()
+        for kind, operators in self._operators.items():
+            registry._operators[kind] = dict(operators)
+        return registry
+
+
+def _register_builtin_operators(registry: OperatorRegistry):
+    registry.register(
+        'selection', 'tournament',
+        lambda population, num_select, minimize, config: SelectionMethods.tournament_selection(
+            population, config.get('tournament_size', 3), num_select, minimize))
+    registry.register(
+        'selection', 'roulette',
+        lambda population, num_select, minimize, config: SelectionMethods.roulette_wheel_selection(
+            population, num_select, minimize))
+    registry.register(
+        'selection', 'best',
+        lambda population, num_select, minimize, config: SelectionMethods.best_selection(
+            population, num_select, minimize))
+
+    registry.register('crossover', 'one_point', CrossoverMethods.one_point_crossover)
+    registry.register('crossover', 'two_point', CrossoverMethods.two_point_crossover)
+    registry.register('crossover', 'uniform', CrossoverMethods.uniform_crossover)
+    registry.register(
+        'crossover', 'discrete',
+        lambda gene1, gene2: (CrossoverMethods.discrete_crossover(gene1, gene2),
+                              CrossoverMethods.discrete_crossover(gene2, gene1)))
+
+    registry.register('mutation', 'one_point', MutationMethods.one_point_mutation, batch=True)
+    registry.register(
+        'mutation', 'two_point',
+        lambda genes, p_mutation: MutationMethods.two_point_mutation(genes), batch=True)
+    registry.register(
+        'mutation', 'boundary',
+        lambda genes, p_mutation: MutationMethods.boundary_mutation(genes), batch=True)
+
+    registry.register('inversion', 'two_point', InversionMethods.two_point_inversion, batch=True)
+
+
+default_registry = OperatorRegistry()
+_register_builtin_operators(default_registry)
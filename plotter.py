@@ -8,8 +8,8 @@ def plot_best_fitness(history):
         messagebox.showinfo("No Data", "No history data to plot.")
         return
     try:
-        epochs = [h['epoch'] for h in history]
-        best_fitness = [h['best_fitness'] for h in history]
+        epochs = history.epochs
+        best_fitness = history.column('best_fitness')
         
         plt.figure(figsize=(10, 6))
         plt.plot(epochs, best_fitness, marker='.', linestyle='-')
@@ -29,12 +29,12 @@ def plot_avg_std_dev(history):
         messagebox.showinfo("No Data", "No history data to plot.")
         return
     try:
-        epochs = [h['epoch'] for h in history]
-        avg_fitness = [h['average_fitness'] for h in history]
-        std_dev = [h['std_fitness'] for h in history]
+        epochs = history.epochs
+        avg_fitness = history.column('average_fitness')
+        std_dev = history.column('std_fitness')
         
-        avg_plus_std = [a + s for a, s in zip(avg_fitness, std_dev)]
-        avg_minus_std = [a - s for a, s in zip(avg_fitness, std_dev)]
+        avg_plus_std = avg_fitness + std_dev
+        avg_minus_std = avg_fitness - std_dev
         
         plt.figure(figsize=(10, 6))
         plt.plot(epochs, avg_fitness, marker='.', linestyle='-', label='Average Fitness Value')
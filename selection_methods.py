@@ -26,13 +26,12 @@ class SelectionMethods:
     @staticmethod
     def roulette_wheel_selection(population: list, num_select: int, minimize: bool) -> list:
         """Select individuals using roulette wheel selection."""
-        roulette_population = population.copy()
         if minimize:
-            for ind in roulette_population:
-                ind.fitness = 1 / (ind.fitness + 1e-10)
-        total_fitness = sum(ind.fitness for ind in roulette_population)
-        probabilities = [ind.fitness /
-                         total_fitness for ind in roulette_population]
+            weights = [1 / (ind.fitness + 1e-10) for ind in population]
+        else:
+            weights = [ind.fitness for ind in population]
+        total_fitness = sum(weights)
+        probabilities = [w / total_fitness for w in weights]
         selected = random.choices(
-            roulette_population, weights=probabilities, k=num_select)
+            population, weights=probabilities, k=num_select)
         return selected
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+class SurrogateModel:
+    """
+    Cheap k-nearest-neighbour model of the fitness function.
+
+    Predictions are inverse-distance weighted averages of the fitness of the
+    closest archived points. Distances are measured on decoded values scaled
+    by the variable bounds, so every variable counts equally. The archive
+    keeps only the most recent 'archive_size' evaluations.
+    """
+
+    def __init__(self, bounds, n_neighbors=5, archive_size=2000):
+        if not isinstance(n_neighbors, int) or n_neighbors <= 0:
+            raise ValueError("Number of neighbours must be a positive integer.")
+        if not isinstance(archive_size, int) or archive_size < n_neighbors:
+            raise ValueError("Archive size must be an integer not smaller than the number of neighbours.")
+
+        self.n_neighbors = n_neighbors
+        self.archive_size = archive_size
+        self._lower = np.array([b[0] for b in bounds], dtype=float)
+        self._scale = np.array([b[1] - b[0] for b in bounds], dtype=float)
+        self._points = np.empty((archive_size, len(bounds)))
+        self._fitness = np.empty(archive_size)
+        self._count = 0
+
+    def __len__(self):
+        return min(self._count, self.archive_size)
+
+    def add(self, values: list, fitness: float):
+        """Archive one truly evaluated point."""
+        index = self._count % self.archive_size
+        self._points[index] = (np.asarray(values, dtype=float) - self._lower) / self._scale
+        self._fitness[index] = fitness
+        self._count += 1
+
+    def predict(self, values: list) -> np.ndarray:
+        """Predict the fitness of a batch of decoded value vectors."""
+        n = len(self)
+        queries = (np.asarray(values, dtype=float) - self._lower) / self._scale
+        distances = np.linalg.norm(queries[:, None, :] - self._points[None, :n, :], axis=2)
+
+        k = min(self.n_neighbors, n)
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+        weights = 1.0 / np.maximum(nearest_distances, 1e-12)
+        return (weights * self._fitness[:n][nearest]).sum(axis=1) / weights.sum(axis=1)
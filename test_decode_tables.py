@@ -0,0 +1,53 @@
+import random
+import pytest
+from chromosome import Chromosome, GeneSpec, gray_to_binary, scale_to_bounds
+from genetic_algorithm import GeneticAlgorithm
+
+CASES = [
+    ([(-3, 4), (-3, 4)], 3),
+    ([(-5.12, 5.12), (0, 1)], 2),
+    ([(-32.768, 32.768)], 3),
+    ([(-100, 100), (-1.5, 4)], 2),
+    # bounds on a rounding tie, where np.round and round() disagree
+    ([(-2.675, 2.675), (-0.45, 0.45)], 2),
+    ([(-0.35, 1.65)], 1),
+]
+
+
+def _build_ga(bounds, precision, encoding):
+    config = {
+        'population_size': 4, 'n_variables': len(bounds), 'bounds': bounds, 'precision': precision,
+        'p_mutation': 0.1, 'p_inversion': 0.1, 'elite_p': 0.25, 'optimization': 'min',
+        'encoding': encoding, 'decode_lut': True
+    }
+    return GeneticAlgorithm(config, lambda values: sum(values))
+
+
+@pytest.mark.parametrize('encoding', ['binary', 'gray'])
+@pytest.mark.parametrize('bounds, precision', CASES)
+def test_tables_match_arithmetic_decoding(bounds, precision, encoding):
+    """Every table entry must equal the value Chromosome.decode computes without tables."""
+    ga = _build_ga(bounds, precision, encoding)
+
+    for bound, table in zip(bounds, ga.decode_tables):
+        assert table is not None
+        m = ga._calculate_gene_length(bound, precision)
+        assert len(table) == 2**m
+        for int_value in range(2**m):
+            value = gray_to_binary(int_value) if encoding == 'gray' else int_value
+            assert float(table[int_value]) == scale_to_bounds(value, bound, m, precision)
+
+
+@pytest.mark.parametrize('encoding', ['binary', 'gray'])
+@pytest.mark.parametrize('bounds, precision', CASES)
+def test_chromosome_decode_with_and_without_tables(bounds, precision, encoding):
+    ga = _build_ga(bounds, precision, encoding)
+    with_tables = GeneSpec(bounds, precision, encoding, ga.decode_tables)
+    without_tables = GeneSpec(bounds, precision, encoding)
+
+    rng = random.Random(0)
+    lengths = [ga._calculate_gene_length(bound, precision) for bound in bounds]
+    for _ in range(500):
+        genes = [''.join(rng.choice('01') for _ in range(m)) for m in lengths]
+        assert (Chromosome.from_spec(genes, with_tables).decode()
+                == Chromosome.from_spec(genes, without_tables).decode())